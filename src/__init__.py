@@ -1,7 +1,7 @@
-"""
-Subtitle Downloader package.
-
-Run the GUI app with:
-    python -m src.subtitle_downloader
-"""
-__version__ = "1.1.0"
+"""
+Subtitle Downloader package.
+
+Run the GUI app with:
+    python -m src.subtitle_downloader
+"""
+__version__ = "1.1.0"
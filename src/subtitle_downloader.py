@@ -1,436 +1,770 @@
-import os
-from typing import Optional
-
-import requests
-import customtkinter as ctk
-from tkinter import filedialog, messagebox
-
-# ---------- CONFIG ----------
-OPENSUBTITLES_API_URL = "https://api.opensubtitles.com/api/v1"
-
-# Use env var if set, otherwise fall back to your key
-OPENSUBTITLES_API_TOKEN = os.getenv("OPENSUBTITLES_API_KEY")
-
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DEFAULT_DOWNLOAD_DIR = os.path.join(PROJECT_ROOT, "subtitles")
-ICON_PATH = os.path.join(PROJECT_ROOT, "assets", "icon.ico")
-
-USER_AGENT = "SubtitleDownloader v1.0"
-
-USER_JWT_TOKEN = None
-
-
-# ---------- API HELPERS ----------
-def _get_headers() -> dict:
-    """Common headers for all OpenSubtitles API requests."""
-    if not OPENSUBTITLES_API_TOKEN:
-        raise RuntimeError("OpenSubtitles API key is missing.")
-    headers = {
-        "Api-Key": OPENSUBTITLES_API_TOKEN,
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "User-Agent": USER_AGENT,
-    }
-    if USER_JWT_TOKEN:
-        headers["Authorization"] = f"Bearer {USER_JWT_TOKEN}"
-    return headers
-
-
-def search_subtitles(title: str, lang: str = "en"):
-    """
-    Search subtitles from OpenSubtitles by movie title and language.
-
-    GET /subtitles
-    """
-    headers = _get_headers()
-    params = {
-        "query": title,
-        "languages": lang,
-        "order_by": "download_count",
-        "order_direction": "desc",
-        "type": "movie",
-    }
-
-    resp = requests.get(
-        f"{OPENSUBTITLES_API_URL}/subtitles",
-        headers=headers,
-        params=params,
-        timeout=15,
-    )
-
-    # Debug output for API response
-    print("[DEBUG] Search subtitles response status:", resp.status_code)
-    print("[DEBUG] Search subtitles response text:", resp.text)
-
-    if resp.status_code == 401:
-        raise RuntimeError("Unauthorized: check your API key or login.")
-    if resp.status_code == 403:
-        raise RuntimeError("Forbidden: check your API key or login.")
-    if resp.status_code == 429:
-        raise RuntimeError("Too many requests: rate limit exceeded.")
-    resp.raise_for_status()
-
-    data = resp.json()
-    return data.get("data", [])
-
-
-def download_subtitle_file(file_id: int, download_dir: str) -> str:
-    """
-    Download a subtitle file by file_id to download_dir.
-
-    POST /download
-    Body: { "file_id": <int> }
-    Response has 'link' with the download URL.
-    """
-    headers = _get_headers()
-    payload = {"file_id": file_id}
-
-    # 1) Ask OpenSubtitles for a download link
-    resp = requests.post(
-        f"{OPENSUBTITLES_API_URL}/download",
-        headers=headers,
-        json=payload,
-        timeout=15,
-    )
-
-    if resp.status_code == 401:
-        raise RuntimeError("Unauthorized: check your API key.")
-    if resp.status_code == 429:
-        raise RuntimeError("Too many requests: rate limit exceeded.")
-    resp.raise_for_status()
-
-    info = resp.json()
-    link = info.get("link")
-    file_name = info.get("file_name", f"subtitle_{file_id}.srt")
-
-    if not link:
-        raise RuntimeError("No download link returned from API.")
-
-    # 2) Download the actual subtitle file
-    os.makedirs(download_dir, exist_ok=True)
-    file_path = os.path.join(download_dir, file_name)
-
-    file_resp = requests.get(link, timeout=30)
-    file_resp.raise_for_status()
-
-    with open(file_path, "wb") as f:
-        f.write(file_resp.content)
-
-    return file_path
-
-
-# ---------- GUI APP ----------
-class SubtitleDownloaderApp(ctk.CTk):
-    def __init__(self):
-        super().__init__()
-
-        # CustomTkinter setup
-        ctk.set_appearance_mode("dark")  # default dark theme
-        ctk.set_default_color_theme("blue")
-
-        self.title("Movie Subtitle Downloader")
-        self.geometry("800x650")
-        self.resizable(False, False)
-
-        # Set icon if available (Windows-friendly)
-        if os.path.exists(ICON_PATH):
-            try:
-                self.iconbitmap(ICON_PATH)
-            except Exception:
-                pass
-
-        # State
-        self.subtitles_data = []
-        self.download_dir = DEFAULT_DOWNLOAD_DIR
-        self.selected_index = ctk.IntVar(value=-1)
-
-        self.username_entry = None
-        self.password_entry = None
-        self.jwt_token = None
-        self.username = ""
-        self.password = ""
-        self._build_ui()
-
-    # ---------- UI BUILD ----------
-    def _build_ui(self):
-        self.grid_columnconfigure(0, weight=0)
-        self.grid_columnconfigure(1, weight=1)
-        left = ctk.CTkFrame(self, corner_radius=20)
-        left.grid(row=0, column=0, padx=20, pady=20, sticky="ns")
-        left.grid_rowconfigure(14, weight=1)
-
-        # Username
-        lbl_username = ctk.CTkLabel(left, text="OpenSubtitles Username:")
-        lbl_username.grid(row=0, column=0, padx=20, pady=(10, 5), sticky="w")
-        self.username_entry = ctk.CTkEntry(left, width=220, placeholder_text="username")
-        self.username_entry.grid(row=1, column=0, padx=20, pady=(0, 10))
-        # Password
-        lbl_password = ctk.CTkLabel(left, text="OpenSubtitles Password:")
-        lbl_password.grid(row=2, column=0, padx=20, pady=(10, 5), sticky="w")
-        self.password_entry = ctk.CTkEntry(left, width=220, placeholder_text="password", show="*")
-        self.password_entry.grid(row=3, column=0, padx=20, pady=(0, 10))
-        # Login button
-        btn_login = ctk.CTkButton(left, text="Login", command=self.on_login_clicked)
-        btn_login.grid(row=4, column=0, padx=20, pady=(10, 5), sticky="w")
-        # Register button next to Login
-        btn_register = ctk.CTkButton(left, text="Register", command=lambda: self.open_register_url())
-        btn_register.grid(row=4, column=0, padx=(120, 20), pady=(10, 5), sticky="e")
-        self.login_controls = [lbl_username, self.username_entry, lbl_password, self.password_entry, btn_login, btn_register]
-
-        # Info label for login status
-        self.login_status_label = ctk.CTkLabel(left, text="Please login to search and download subtitles.", text_color="#FFB347")
-        self.login_status_label.grid(row=5, column=0, padx=20, pady=(10, 5))
-        # Group login controls for easy hiding
-        self.login_controls = [lbl_username, self.username_entry, lbl_password, self.password_entry, btn_login, btn_register, self.login_status_label]
-
-        # Search controls (hidden until login)
-        self.search_controls = []
-        lbl_movie = ctk.CTkLabel(left, text="Movie title:")
-        lbl_movie.grid(row=6, column=0, padx=20, pady=(10, 5), sticky="w")
-        self.search_controls.append(lbl_movie)
-        self.movie_entry = ctk.CTkEntry(left, width=220, placeholder_text="e.g. Inception")
-        self.movie_entry.grid(row=7, column=0, padx=20, pady=(0, 10))
-        self.search_controls.append(self.movie_entry)
-        # Language
-        lbl_lang = ctk.CTkLabel(left, text="Language:")
-        lbl_lang.grid(row=8, column=0, padx=20, pady=(10, 5), sticky="w")
-        self.search_controls.append(lbl_lang)
-        self.lang_option = ctk.CTkOptionMenu(left, values=["en", "es", "fr", "de", "it", "pt", "ru", "ko", "ja"], width=220)
-        self.lang_option.set("en")
-        self.lang_option.grid(row=9, column=0, padx=20, pady=(0, 10))
-        self.search_controls.append(self.lang_option)
-        # Folder
-        btn_folder = ctk.CTkButton(left, text="Choose download folder", command=self.choose_folder)
-        btn_folder.grid(row=10, column=0, padx=20, pady=(10, 5))
-        self.search_controls.append(btn_folder)
-        self.folder_label = ctk.CTkLabel(left, text=f"→ {self.download_dir}", wraplength=220, justify="left")
-        self.folder_label.grid(row=11, column=0, padx=20, pady=(0, 10))
-        self.search_controls.append(self.folder_label)
-        # Search
-        btn_search = ctk.CTkButton(left, text="Search Subtitles", command=self.on_search_clicked)
-        btn_search.grid(row=12, column=0, padx=20, pady=(20, 10), sticky="ew")
-        self.search_controls.append(btn_search)
-        # Theme switch
-        self.theme_switch = ctk.CTkSwitch(left, text="Dark mode", command=self.toggle_theme)
-        self.theme_switch.select()
-        self.theme_switch.grid(row=13, column=0, padx=20, pady=(0, 20), sticky="s")
-
-        # Footer copyright label
-        footer_label = ctk.CTkLabel(
-            left,
-            text="© 2025 lahirusanjika | GitHub: github.com/lahirusanjika",
-            font=ctk.CTkFont(size=12),
-            text_color="#888888"
-        )
-        footer_label.grid(row=14, column=0, padx=20, pady=(10, 5), sticky="s")
-
-        # Hide search controls initially
-        for widget in self.search_controls:
-            widget.grid_remove()
-
-        # RIGHT PANEL
-        right = ctk.CTkFrame(self, corner_radius=20)
-        right.grid(row=0, column=1, padx=(0, 20), pady=20, sticky="nsew")
-        right.grid_rowconfigure(1, weight=1)
-        right.grid_columnconfigure(0, weight=1)
-
-        lbl_results = ctk.CTkLabel(
-            right,
-            text="Results",
-            font=ctk.CTkFont(size=18, weight="bold"),
-        )
-        lbl_results.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="w")
-
-        self.results_box = ctk.CTkScrollableFrame(
-            right, width=600, height=350
-        )
-        self.results_box.grid(row=1, column=0, padx=20, pady=(0, 10), sticky="nsew")
-
-        self.result_buttons = []
-
-        btn_download = ctk.CTkButton(
-            right,
-            text="Download Selected Subtitle",
-            command=self.on_download_clicked,
-        )
-        btn_download.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="e")
-
-        self.status_label = ctk.CTkLabel(
-            right,
-            text="Enter a movie title and click Search.",
-            anchor="w",
-            justify="left",
-        )
-        self.status_label.grid(row=3, column=0, padx=20, pady=(0, 5), sticky="w")
-
-        self.progress_bar = ctk.CTkProgressBar(
-            right, mode="indeterminate"
-        )
-        self.progress_bar.grid(row=4, column=0, padx=20, pady=(0, 20), sticky="ew")
-        self.progress_bar.grid_remove()
-
-    # ---------- PROGRESS ----------
-    def start_progress(self, text: Optional[str] = None):
-        if text:
-            self.status_label.configure(text=text)
-        self.progress_bar.grid()
-        self.progress_bar.start()
-
-    def stop_progress(self, text: Optional[str] = None):
-        self.progress_bar.stop()
-        self.progress_bar.grid_remove()
-        if text:
-            self.status_label.configure(text=text)
-
-    # ---------- GUI BEHAVIOR ----------
-    def choose_folder(self):
-        folder = filedialog.askdirectory()
-        if folder:
-            self.download_dir = folder
-            self.folder_label.configure(text=f"→ {self.download_dir}")
-
-    def toggle_theme(self):
-        if self.theme_switch.get():
-            ctk.set_appearance_mode("dark")
-        else:
-            ctk.set_appearance_mode("light")
-
-    def clear_results(self):
-        for btn in self.result_buttons:
-            btn.destroy()
-        self.result_buttons.clear()
-        self.subtitles_data.clear()
-        self.selected_index.set(-1)
-
-    def on_search_clicked(self):
-        title = self.movie_entry.get().strip()
-        lang = self.lang_option.get()
-
-        if not title:
-            messagebox.showwarning("Input error", "Please enter a movie title.")
-            return
-
-        self.clear_results()
-        self.start_progress("Searching subtitles...")
-
-        try:
-            results = search_subtitles(title, lang)
-        except Exception as e:
-            self.stop_progress("Search failed.")
-            messagebox.showerror("Search error", str(e))
-            return
-
-        if not results:
-            self.stop_progress("No subtitles found.")
-            return
-
-        self.subtitles_data = results
-
-        for idx, item in enumerate(results):
-            attrs = item.get("attributes", {})
-            release = attrs.get("release", "Unknown release")
-            lang_code = attrs.get("language", "??")
-            year = attrs.get("year") or ""
-            downloads = attrs.get("download_count", attrs.get("downloads", 0))
-            text = f"{idx+1}. [{lang_code}] {release} ({year}) - {downloads} downloads"
-            rb = ctk.CTkRadioButton(
-                self.results_box,
-                text=text,
-                value=idx,
-                variable=self.selected_index,
-                width=580
-            )
-            rb.grid(row=idx, column=0, padx=10, pady=2, sticky="w")
-            self.result_buttons.append(rb)
-
-        self.stop_progress(f"Found {len(results)} subtitles.")
-
-    def on_download_clicked(self):
-        if not self.subtitles_data:
-            messagebox.showwarning(
-                "No subtitles", "Search and select a subtitle first."
-            )
-            return
-
-        idx = self.selected_index.get()
-        if idx < 0 or idx >= len(self.subtitles_data):
-            messagebox.showwarning(
-                "No selection", "Please select a subtitle from the list."
-            )
-            return
-
-        subtitle = self.subtitles_data[idx]
-        attrs = subtitle.get("attributes", {})
-        files = attrs.get("files", [])
-        if not files:
-            messagebox.showerror("No file", "No downloadable file found for this subtitle.")
-            return
-
-        file_id = files[0].get("file_id")
-        if not file_id:
-            messagebox.showerror("No file id", "Cannot find file ID to download.")
-            return
-
-        self.start_progress("Downloading subtitle...")
-
-        try:
-            path = download_subtitle_file(file_id, self.download_dir)
-        except Exception as e:
-            self.stop_progress("Download failed.")
-            messagebox.showerror("Download error", str(e))
-            return
-
-        self.stop_progress(f"Downloaded to: {path}")
-        messagebox.showinfo("Download complete", f"Subtitle saved as:\n{path}")
-
-    def on_login_clicked(self):
-        username = self.username_entry.get().strip()
-        password = self.password_entry.get().strip()
-        if not username or not password:
-            messagebox.showwarning("Login error", "Please enter both username and password.")
-            return
-        self.start_progress("Logging in...")
-        try:
-            token = self.login_opensubtitles(username, password)
-            global USER_JWT_TOKEN
-            USER_JWT_TOKEN = token
-            self.jwt_token = token
-            self.username = username
-            self.password = password
-        except Exception as e:
-            self.stop_progress("Login failed.")
-            messagebox.showerror("Login error", f"Failed to login:\n{e}")
-            return
-        self.stop_progress("Login successful.")
-        messagebox.showinfo("Login", "Login successful! You can now search and download unlimited subtitles.")
-        # Hide all login controls after login
-        for widget in self.login_controls:
-            widget.grid_remove()
-        # Enable and show search controls
-        for widget in self.search_controls:
-            widget.configure(state="normal")
-            widget.grid()
-
-    def open_register_url(self):
-        import webbrowser
-        webbrowser.open("https://www.opensubtitles.com/")
-
-    def login_opensubtitles(self, username, password):
-        url = f"{OPENSUBTITLES_API_URL}/login"
-        headers = {
-            "Api-Key": OPENSUBTITLES_API_TOKEN,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": USER_AGENT,
-        }
-        payload = {"username": username, "password": password}
-        resp = requests.post(url, headers=headers, json=payload, timeout=15)
-        if resp.status_code != 200:
-            raise RuntimeError(f"Login failed: {resp.text}")
-        data = resp.json()
-        return data.get("token")
-
-
-if __name__ == "__main__":
-    app = SubtitleDownloaderApp()
-    app.mainloop()
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+from urllib3.util.retry import Retry
+import customtkinter as ctk
+from tkinter import filedialog, messagebox, ttk
+
+# orjson decodes straight from bytes, several times faster than stdlib
+# json on medium search bodies; fall back silently when not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# ---------- CONFIG ----------
+OPENSUBTITLES_API_URL = "https://api.opensubtitles.com/api/v1"
+
+# Use env var if set, otherwise fall back to your key
+OPENSUBTITLES_API_TOKEN = os.getenv("OPENSUBTITLES_API_KEY")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DOWNLOAD_DIR = os.path.join(PROJECT_ROOT, "subtitles")
+ICON_PATH = os.path.join(PROJECT_ROOT, "assets", "icon.ico")
+_ICON_EXISTS = os.path.exists(ICON_PATH)  # stat once at import, not per launch
+
+_LANGUAGES = ("en", "es", "fr", "de", "it", "pt", "ru", "ko", "ja")
+SEARCH_CACHE_PATH = os.path.join(PROJECT_ROOT, ".cache", "search.json")
+SEARCH_CACHE_TTL = 3600  # seconds a cached search stays fresh
+SEARCH_CACHE_MAX_ENTRIES = 128
+
+USER_AGENT = "SubtitleDownloader v1.0"
+
+USER_JWT_TOKEN = None
+
+log = logging.getLogger(__name__)
+
+
+# Worker pool for blocking network calls so the Tk event loop never waits
+# on a socket. Threads suffice: requests releases the GIL on socket reads.
+_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+class _SearchCache:
+    """
+    Small on-disk TTL cache for search results, keyed by (title, lang).
+
+    Repeat searches skip the network entirely, and recent results stay
+    usable through transient failures or rate-limit 429s. Bounded LRU so
+    the cache file stays small.
+    """
+
+    def __init__(self, path: str, ttl: int = SEARCH_CACHE_TTL,
+                 max_entries: int = SEARCH_CACHE_MAX_ENTRIES):
+        self._path = path
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._load()
+
+    @staticmethod
+    def _key(title: str, lang: str) -> str:
+        return f"{title.casefold().strip()}|{lang}"
+
+    def _load(self):
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                self._entries.update(json.load(f))
+        except (OSError, ValueError):
+            pass  # missing or corrupt cache file: start empty
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(self._path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+        except OSError:
+            pass  # caching is best-effort; never fail the search over it
+
+    def get(self, title: str, lang: str):
+        entry = self._entries.get(self._key(title, lang))
+        if entry is None:
+            return None
+        ts, results = entry
+        if time.time() - ts >= self._ttl:
+            del self._entries[self._key(title, lang)]
+            return None
+        self._entries.move_to_end(self._key(title, lang))
+        # Hand out a copy: callers mutate their result list (clear_results
+        # empties it in place), which must never touch the cached one.
+        return list(results)
+
+    def put(self, title: str, lang: str, results):
+        key = self._key(title, lang)
+        self._entries[key] = (time.time(), list(results))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._save()
+
+
+_SEARCH_CACHE = _SearchCache(SEARCH_CACHE_PATH)
+
+
+# ---------- API HELPERS ----------
+_SESSION: Optional[requests.Session] = None
+_SESSION_JWT_TOKEN = None  # token the session headers were last built with
+
+# Optional HTTP/2 client for the subtitle file fetch: the CDN speaks h2,
+# so concurrent downloads can multiplex over one connection instead of
+# queueing on HTTP/1.1 keep-alive. requests is HTTP/1.1 only; this is
+# gated on httpx[http2] being installed and falls back to the session.
+try:
+    import httpx
+    _HTTP2_CLIENT = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        timeout=30.0,
+        headers={"User-Agent": USER_AGENT},
+    )
+except ImportError:
+    _HTTP2_CLIENT = None
+
+
+def _get_session() -> requests.Session:
+    """
+    Shared HTTP session for all OpenSubtitles calls.
+
+    Keep-alive + connection pooling means only the first request pays the
+    TCP/TLS handshake; headers are refreshed whenever the login token changes.
+    Transient 5xx and rate-limit 429s are retried with exponential backoff
+    inside the HTTP layer, honoring Retry-After, so a blip doesn't force
+    the user to re-click.
+    """
+    global _SESSION, _SESSION_JWT_TOKEN
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            # Hand the final response back so the callers' status-code
+            # branches still produce their friendly error messages.
+            raise_on_status=False,
+        )
+        _SESSION.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=20, max_retries=retry
+            ),
+        )
+        _SESSION.headers.update(_get_headers())
+        _SESSION_JWT_TOKEN = USER_JWT_TOKEN
+    elif _SESSION_JWT_TOKEN != USER_JWT_TOKEN:
+        _SESSION.headers.update(_get_headers())
+        _SESSION_JWT_TOKEN = USER_JWT_TOKEN
+    return _SESSION
+
+
+_CACHED_HEADERS: Optional[dict] = None
+
+
+def _invalidate_headers() -> None:
+    """Drop the cached header dict so the next request rebuilds it."""
+    global _CACHED_HEADERS
+    _CACHED_HEADERS = None
+
+
+def _get_headers() -> dict:
+    """Common headers for all OpenSubtitles API requests.
+
+    Cached between calls; invalidated whenever the login state changes.
+    """
+    global _CACHED_HEADERS
+    if _CACHED_HEADERS is not None:
+        return _CACHED_HEADERS
+    if not OPENSUBTITLES_API_TOKEN:
+        raise RuntimeError("OpenSubtitles API key is missing.")
+    headers = {
+        "Api-Key": OPENSUBTITLES_API_TOKEN,
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        # requests decompresses transparently; gzip alone cuts search
+        # bodies several-fold (br too, when brotli is installed)
+        "Accept-Encoding": "gzip, deflate, br",
+        "User-Agent": USER_AGENT,
+    }
+    if USER_JWT_TOKEN:
+        headers["Authorization"] = f"Bearer {USER_JWT_TOKEN}"
+    _CACHED_HEADERS = headers
+    return headers
+
+
+def search_subtitles(title: str, lang: str = "en"):
+    """
+    Search subtitles from OpenSubtitles by movie title and language.
+
+    GET /subtitles
+
+    Results are served from the on-disk cache when a fresh entry exists.
+    """
+    cached = _SEARCH_CACHE.get(title, lang)
+    if cached is not None:
+        return cached
+
+    params = {
+        "query": title,
+        "languages": lang,
+        "order_by": "download_count",
+        "order_direction": "desc",
+        "type": "movie",
+        # Don't ask for more rows than the results pane usefully shows
+        "per_page": 50,
+    }
+
+    resp = _get_session().get(
+        f"{OPENSUBTITLES_API_URL}/subtitles",
+        params=params,
+        timeout=15,
+    )
+
+    # Materialize the body once as bytes; nothing below decodes it twice
+    body = resp.content
+    log.debug("search status=%s bytes=%d", resp.status_code, len(body))
+
+    if resp.status_code == 401:
+        raise RuntimeError("Unauthorized: check your API key or login.")
+    if resp.status_code == 403:
+        raise RuntimeError("Forbidden: check your API key or login.")
+    if resp.status_code == 429:
+        raise RuntimeError("Too many requests: rate limit exceeded.")
+    resp.raise_for_status()
+
+    data = _json_loads(body)
+    results = data.get("data", [])
+    _SEARCH_CACHE.put(title, lang, results)
+    return results
+
+
+# /download links stay valid for a few hours; cache them so re-downloading
+# the same file skips the link-minting round-trip (and its rate-limit cost).
+LINK_CACHE_TTL = 3600  # seconds
+_LINK_CACHE: dict = {}  # file_id -> (expiry, link, file_name)
+
+_ENSURED_DIRS: set = set()  # download dirs already created this run
+
+# Filename characters invalid on Windows (plus NUL); one C-level
+# translate pass per name keeps sanitizing off the per-download budget.
+_BAD_CHARS = str.maketrans({c: "_" for c in '\\/:*?"<>|\x00'})
+
+
+def _ensure_dir(path: str) -> None:
+    """os.makedirs, but only one stat per directory per run."""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _write_stream(chunks, file_path: str, total: int, progress_cb) -> None:
+    """Write an iterable of byte chunks to file_path, reporting progress."""
+    downloaded = 0
+    with open(file_path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+            if progress_cb is not None:
+                downloaded += len(chunk)
+                progress_cb(downloaded, total)
+
+
+def download_subtitle_file(file_id: int, download_dir: str, progress_cb=None) -> str:
+    """
+    Download a subtitle file by file_id to download_dir.
+
+    POST /download
+    Body: { "file_id": <int> }
+    Response has 'link' with the download URL.
+
+    progress_cb, if given, is called as progress_cb(downloaded, total)
+    after each written chunk (total is 0 when Content-Length is absent).
+    """
+    # 1) Ask OpenSubtitles for a download link (unless a fresh one is cached)
+    link = file_name = None
+    cached = _LINK_CACHE.get(file_id)
+    if cached is not None:
+        expiry, link, file_name = cached
+        if time.time() >= expiry:
+            del _LINK_CACHE[file_id]
+            link = file_name = None
+
+    if link is None:
+        resp = _get_session().post(
+            f"{OPENSUBTITLES_API_URL}/download",
+            json={"file_id": file_id},
+            timeout=15,
+        )
+
+        if resp.status_code == 401:
+            raise RuntimeError("Unauthorized: check your API key.")
+        if resp.status_code == 429:
+            raise RuntimeError("Too many requests: rate limit exceeded.")
+        resp.raise_for_status()
+
+        info = _json_loads(resp.content)
+        link = info.get("link")
+        file_name = info.get("file_name", f"subtitle_{file_id}.srt")
+
+        if not link:
+            raise RuntimeError("No download link returned from API.")
+        _LINK_CACHE[file_id] = (time.time() + LINK_CACHE_TTL, link, file_name)
+
+    # 2) Download the actual subtitle file. The name comes straight from
+    # the API: strip any path component and neutralize invalid characters
+    # so it cannot escape download_dir.
+    safe_name = os.path.basename(file_name).translate(_BAD_CHARS)
+    if not safe_name:
+        safe_name = f"subtitle_{file_id}.srt"
+    _ensure_dir(download_dir)
+    file_path = os.path.join(download_dir, safe_name)
+
+    # Stream straight from the socket to disk instead of buffering the
+    # whole body in memory first. Prefer the multiplexed HTTP/2 client
+    # for the CDN fetch when available.
+    try:
+        if _HTTP2_CLIENT is not None:
+            with _HTTP2_CLIENT.stream("GET", link) as file_resp:
+                file_resp.raise_for_status()
+                total = int(file_resp.headers.get("Content-Length", 0))
+                _write_stream(
+                    file_resp.iter_bytes(64 * 1024), file_path, total, progress_cb
+                )
+        else:
+            with _get_session().get(link, timeout=30, stream=True) as file_resp:
+                file_resp.raise_for_status()
+                total = int(file_resp.headers.get("Content-Length", 0))
+                _write_stream(
+                    file_resp.iter_content(chunk_size=64 * 1024),
+                    file_path, total, progress_cb,
+                )
+    except Exception as e:
+        # A rejected link is most likely expired: drop it from the cache
+        # so the next attempt mints a new one.
+        status = getattr(getattr(e, "response", None), "status_code", None)
+        if status in (403, 404):
+            _LINK_CACHE.pop(file_id, None)
+        raise
+
+    return file_path
+
+
+# ---------- GUI APP ----------
+class SubtitleDownloaderApp(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+
+        # CustomTkinter setup
+        ctk.set_appearance_mode("dark")  # default dark theme
+        ctk.set_default_color_theme("blue")
+
+        self.title("Movie Subtitle Downloader")
+        self.geometry("800x650")
+        self.resizable(False, False)
+
+        # Set icon if available (Windows-friendly)
+        if _ICON_EXISTS:
+            try:
+                self.iconbitmap(ICON_PATH)
+            except Exception:
+                pass
+
+        # State
+        self.subtitles_data = []
+        self.attrs_list = []
+        self.download_dir = DEFAULT_DOWNLOAD_DIR
+        self._progress_determinate = False
+
+        self.username_entry = None
+        self.password_entry = None
+        self.jwt_token = None
+        self.username = ""
+        self.password = ""
+        self._build_ui()
+
+    # ---------- UI BUILD ----------
+    def _build_ui(self):
+        self.grid_columnconfigure(0, weight=0)
+        self.grid_columnconfigure(1, weight=1)
+        left = ctk.CTkFrame(self, corner_radius=20)
+        left.grid(row=0, column=0, padx=20, pady=20, sticky="ns")
+        left.grid_rowconfigure(14, weight=1)
+
+        # Username
+        lbl_username = ctk.CTkLabel(left, text="OpenSubtitles Username:")
+        lbl_username.grid(row=0, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.username_entry = ctk.CTkEntry(left, width=220, placeholder_text="username")
+        self.username_entry.grid(row=1, column=0, padx=20, pady=(0, 10))
+        # Password
+        lbl_password = ctk.CTkLabel(left, text="OpenSubtitles Password:")
+        lbl_password.grid(row=2, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.password_entry = ctk.CTkEntry(left, width=220, placeholder_text="password", show="*")
+        self.password_entry.grid(row=3, column=0, padx=20, pady=(0, 10))
+        # Login button
+        btn_login = ctk.CTkButton(left, text="Login", command=self.on_login_clicked)
+        btn_login.grid(row=4, column=0, padx=20, pady=(10, 5), sticky="w")
+        # Register button next to Login
+        btn_register = ctk.CTkButton(left, text="Register", command=lambda: self.open_register_url())
+        btn_register.grid(row=4, column=0, padx=(120, 20), pady=(10, 5), sticky="e")
+
+        # Info label for login status
+        self.login_status_label = ctk.CTkLabel(left, text="Please login to search and download subtitles.", text_color="#FFB347")
+        self.login_status_label.grid(row=5, column=0, padx=20, pady=(10, 5))
+        # Group login controls for easy hiding
+        self.login_controls = [lbl_username, self.username_entry, lbl_password, self.password_entry, btn_login, btn_register, self.login_status_label]
+
+        # Search controls (hidden until login)
+        self.search_controls = []
+        lbl_movie = ctk.CTkLabel(left, text="Movie title:")
+        lbl_movie.grid(row=6, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.search_controls.append(lbl_movie)
+        self.movie_entry = ctk.CTkEntry(left, width=220, placeholder_text="e.g. Inception")
+        self.movie_entry.grid(row=7, column=0, padx=20, pady=(0, 10))
+        self.search_controls.append(self.movie_entry)
+        # Language
+        lbl_lang = ctk.CTkLabel(left, text="Language:")
+        lbl_lang.grid(row=8, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.search_controls.append(lbl_lang)
+        self.lang_option = ctk.CTkOptionMenu(left, values=list(_LANGUAGES), width=220)
+        self.lang_option.set("en")
+        self.lang_option.grid(row=9, column=0, padx=20, pady=(0, 10))
+        self.search_controls.append(self.lang_option)
+        # Folder
+        btn_folder = ctk.CTkButton(left, text="Choose download folder", command=self.choose_folder)
+        btn_folder.grid(row=10, column=0, padx=20, pady=(10, 5))
+        self.search_controls.append(btn_folder)
+        self.folder_label = ctk.CTkLabel(left, text=f"→ {self.download_dir}", wraplength=220, justify="left")
+        self.folder_label.grid(row=11, column=0, padx=20, pady=(0, 10))
+        self.search_controls.append(self.folder_label)
+        # Search
+        btn_search = ctk.CTkButton(left, text="Search Subtitles", command=self.on_search_clicked)
+        btn_search.grid(row=12, column=0, padx=20, pady=(20, 10), sticky="ew")
+        self.search_controls.append(btn_search)
+        # Theme switch
+        self.theme_switch = ctk.CTkSwitch(left, text="Dark mode", command=self.toggle_theme)
+        self.theme_switch.select()
+        self.theme_switch.grid(row=13, column=0, padx=20, pady=(0, 20), sticky="s")
+
+        # Footer copyright label
+        footer_label = ctk.CTkLabel(
+            left,
+            text="© 2025 lahirusanjika | GitHub: github.com/lahirusanjika",
+            font=ctk.CTkFont(size=12),
+            text_color="#888888"
+        )
+        footer_label.grid(row=14, column=0, padx=20, pady=(10, 5), sticky="s")
+
+        # Hide search controls initially
+        for widget in self.search_controls:
+            widget.grid_remove()
+
+        # RIGHT PANEL
+        right = ctk.CTkFrame(self, corner_radius=20)
+        right.grid(row=0, column=1, padx=(0, 20), pady=20, sticky="nsew")
+        right.grid_rowconfigure(1, weight=1)
+        right.grid_columnconfigure(0, weight=1)
+
+        lbl_results = ctk.CTkLabel(
+            right,
+            text="Results",
+            font=ctk.CTkFont(size=18, weight="bold"),
+        )
+        lbl_results.grid(row=0, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
+
+        # Virtualized result list: a Treeview renders only visible rows,
+        # so large result sets cost O(visible) instead of one widget each.
+        self.results_tree = ttk.Treeview(
+            right,
+            columns=("lang", "release", "year", "downloads"),
+            show="headings",
+            selectmode="extended",
+            height=15,
+        )
+        self.results_tree.heading("lang", text="Lang")
+        self.results_tree.heading("release", text="Release")
+        self.results_tree.heading("year", text="Year")
+        self.results_tree.heading("downloads", text="Downloads")
+        self.results_tree.column("lang", width=50, anchor="w", stretch=False)
+        self.results_tree.column("release", width=380, anchor="w")
+        self.results_tree.column("year", width=60, anchor="center", stretch=False)
+        self.results_tree.column("downloads", width=90, anchor="e", stretch=False)
+        self.results_tree.grid(row=1, column=0, padx=(20, 0), pady=(0, 10), sticky="nsew")
+
+        tree_scroll = ttk.Scrollbar(
+            right, orient="vertical", command=self.results_tree.yview
+        )
+        self.results_tree.configure(yscrollcommand=tree_scroll.set)
+        tree_scroll.grid(row=1, column=1, padx=(0, 20), pady=(0, 10), sticky="ns")
+
+        btn_download = ctk.CTkButton(
+            right,
+            text="Download Selected Subtitles",
+            command=self.on_download_clicked,
+        )
+        btn_download.grid(row=2, column=0, columnspan=2, padx=20, pady=(0, 10), sticky="e")
+
+        self.status_label = ctk.CTkLabel(
+            right,
+            text="Enter a movie title and click Search.",
+            anchor="w",
+            justify="left",
+        )
+        self.status_label.grid(row=3, column=0, columnspan=2, padx=20, pady=(0, 5), sticky="w")
+
+        self.progress_bar = ctk.CTkProgressBar(
+            right, mode="indeterminate"
+        )
+        self.progress_bar.grid(row=4, column=0, columnspan=2, padx=20, pady=(0, 20), sticky="ew")
+        self.progress_bar.grid_remove()
+
+    # ---------- PROGRESS ----------
+    def start_progress(self, text: Optional[str] = None):
+        if text:
+            self.status_label.configure(text=text)
+        self._progress_determinate = False
+        self.progress_bar.configure(mode="indeterminate")
+        self.progress_bar.grid()
+        self.progress_bar.start()
+
+    def stop_progress(self, text: Optional[str] = None):
+        self.progress_bar.stop()
+        self.progress_bar.grid_remove()
+        if text:
+            self.status_label.configure(text=text)
+
+    def _report_progress(self, downloaded, total):
+        # Runs on the worker thread; hop back onto the Tk thread.
+        self.after(0, self._set_progress, downloaded, total)
+
+    def _set_progress(self, downloaded, total):
+        """Drive the bar from real byte counts once the total is known.
+
+        One .set() per 64 KB chunk is far cheaper than the indeterminate
+        animation frame every ~20 ms, and actually informative.
+        """
+        if not total:
+            return
+        if not self._progress_determinate:
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode="determinate")
+            self._progress_determinate = True
+        self.progress_bar.set(min(downloaded / total, 1.0))
+
+    # ---------- GUI BEHAVIOR ----------
+    def choose_folder(self):
+        folder = filedialog.askdirectory()
+        if folder:
+            self.download_dir = folder
+            self.folder_label.configure(text=f"→ {self.download_dir}")
+
+    def toggle_theme(self):
+        if self.theme_switch.get():
+            ctk.set_appearance_mode("dark")
+        else:
+            ctk.set_appearance_mode("light")
+
+    def clear_results(self):
+        self.results_tree.delete(*self.results_tree.get_children())
+        self.subtitles_data.clear()
+        self.attrs_list.clear()
+
+    def _render_results(self, rows):
+        """
+        Fill the results tree with one insert per row.
+
+        Inserts are cheap item records, not widgets; the Treeview only
+        draws the rows currently in view.
+        """
+        tree = self.results_tree
+        tree.delete(*tree.get_children())
+        for idx, values in enumerate(rows):
+            tree.insert("", "end", iid=str(idx), values=values)
+
+    def _poll(self, fut, on_done):
+        """Wait for a background future without blocking the Tk event loop."""
+        if fut.done():
+            on_done(fut)
+        else:
+            self.after(50, self._poll, fut, on_done)
+
+    def _poll_all(self, futs, on_done):
+        """Like _poll, but waits for a whole batch of futures."""
+        if all(f.done() for f in futs):
+            on_done(futs)
+        else:
+            self.after(50, self._poll_all, futs, on_done)
+
+    def on_search_clicked(self):
+        title = self.movie_entry.get().strip()
+        lang = self.lang_option.get()
+
+        if not title:
+            messagebox.showwarning("Input error", "Please enter a movie title.")
+            return
+
+        self.clear_results()
+        self.start_progress("Searching subtitles...")
+
+        fut = _POOL.submit(search_subtitles, title, lang)
+        self.after(50, self._poll, fut, self._on_search_done)
+
+    def _on_search_done(self, fut):
+        try:
+            results = fut.result()
+        except Exception as e:
+            self.stop_progress("Search failed.")
+            messagebox.showerror("Search error", str(e))
+            return
+
+        if not results:
+            self.stop_progress("No subtitles found.")
+            return
+
+        self.subtitles_data = results
+
+        # Extract attributes once; on_download_clicked reuses this list
+        # instead of re-walking each result dict.
+        self.attrs_list = [r.get("attributes", {}) for r in results]
+        rows = [
+            (
+                a.get("language", "??"),
+                a.get("release", "Unknown release"),
+                a.get("year") or "",
+                a.get("download_count", a.get("downloads", 0)),
+            )
+            for a in self.attrs_list
+        ]
+
+        self._render_results(rows)
+        self.stop_progress(f"Found {len(results)} subtitles.")
+
+    def on_download_clicked(self):
+        if not self.subtitles_data:
+            messagebox.showwarning(
+                "No subtitles", "Search and select a subtitle first."
+            )
+            return
+
+        indices = [int(iid) for iid in self.results_tree.selection()]
+        if not indices:
+            messagebox.showwarning(
+                "No selection",
+                "Please select at least one subtitle from the list"
+                " (Ctrl/Shift-click for several).",
+            )
+            return
+
+        file_ids = []
+        for idx in indices:
+            files = self.attrs_list[idx].get("files", [])
+            file_id = files[0].get("file_id") if files else None
+            if not file_id:
+                messagebox.showerror(
+                    "No file", f"No downloadable file found for result {idx + 1}."
+                )
+                return
+            file_ids.append(file_id)
+
+        self.start_progress(f"Downloading {len(file_ids)} subtitle(s)...")
+
+        # Downloads are independent and I/O-bound; the pool size caps
+        # concurrency so we stay clear of the API rate limit. Byte-level
+        # progress only makes sense for a single file.
+        progress_cb = self._report_progress if len(file_ids) == 1 else None
+        futs = [
+            _POOL.submit(
+                download_subtitle_file, file_id, self.download_dir, progress_cb
+            )
+            for file_id in file_ids
+        ]
+        self.after(50, self._poll_all, futs, self._on_downloads_done)
+
+    def _on_downloads_done(self, futs):
+        paths = []
+        errors = []
+        for fut in futs:
+            try:
+                paths.append(fut.result())
+            except Exception as e:
+                errors.append(str(e))
+
+        if errors:
+            self.stop_progress(
+                f"Downloaded {len(paths)} of {len(futs)} subtitles."
+            )
+            messagebox.showerror("Download error", "\n".join(errors))
+            return
+
+        self.stop_progress(f"Downloaded {len(paths)} subtitle(s).")
+        messagebox.showinfo(
+            "Download complete", "Subtitles saved as:\n" + "\n".join(paths)
+        )
+
+    def on_login_clicked(self):
+        username = self.username_entry.get().strip()
+        password = self.password_entry.get().strip()
+        if not username or not password:
+            messagebox.showwarning("Login error", "Please enter both username and password.")
+            return
+        self.start_progress("Logging in...")
+        fut = _POOL.submit(self.login_opensubtitles, username, password)
+        self.after(
+            50, self._poll, fut,
+            lambda f: self._on_login_done(f, username, password),
+        )
+
+    def _on_login_done(self, fut, username, password):
+        try:
+            token = fut.result()
+        except Exception as e:
+            self.stop_progress("Login failed.")
+            messagebox.showerror("Login error", f"Failed to login:\n{e}")
+            return
+        global USER_JWT_TOKEN
+        USER_JWT_TOKEN = token
+        _invalidate_headers()
+        self.jwt_token = token
+        self.username = username
+        self.password = password
+        self.stop_progress("Login successful.")
+        messagebox.showinfo("Login", "Login successful! You can now search and download unlimited subtitles.")
+        # Swap login controls for search controls in one layout pass
+        self.grid_propagate(False)
+        for widget in self.login_controls:
+            widget.grid_remove()
+        for widget in self.search_controls:
+            widget.configure(state="normal")
+            widget.grid()
+        self.grid_propagate(True)
+        self.update_idletasks()
+
+    def open_register_url(self):
+        import webbrowser
+        webbrowser.open("https://www.opensubtitles.com/")
+
+    def login_opensubtitles(self, username, password):
+        url = f"{OPENSUBTITLES_API_URL}/login"
+        headers = {
+            "Api-Key": OPENSUBTITLES_API_TOKEN,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": USER_AGENT,
+        }
+        payload = {"username": username, "password": password}
+        resp = _get_session().post(url, headers=headers, json=payload, timeout=15)
+        body = resp.content
+        if resp.status_code != 200:
+            raise RuntimeError(f"Login failed: {body[:256]!r}")
+        data = _json_loads(body)
+        return data.get("token")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    app = SubtitleDownloaderApp()
+    app.mainloop()